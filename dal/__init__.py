@@ -1,41 +1,75 @@
 """Data Access Layer package initialization for ClassicModels database."""
 
+import logging
+
+# DAL modules log through the "dal" logger; applications opt in to the output
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from .customer_dal import (
     get_all_customers,
+    iter_all_customers,
     get_customer_by_number,
+    get_customer_summary_by_number,
+    get_customers_by_numbers,
     get_customers_by_country,
     get_customers_by_sales_rep,
+    get_customer_with_orders,
+    get_customers_with_order_counts,
     insert_customer,
+    insert_customers_bulk,
     update_customer,
+    update_customers_bulk,
     delete_customer
 )
 
 from .order_dal import (
     get_all_orders,
+    iter_all_orders,
     get_order_by_number,
+    get_order_summary_by_number,
+    get_orders_by_numbers,
     get_orders_by_customer,
     get_orders_by_status,
     insert_order,
+    insert_orders_bulk,
     update_order_status,
+    update_order_statuses_bulk,
     get_order_details
 )
 
+from ._cache import release_pending_writes
+
 __all__ = [
     # Customer operations
     'get_all_customers',
+    'iter_all_customers',
     'get_customer_by_number',
+    'get_customer_summary_by_number',
+    'get_customers_by_numbers',
     'get_customers_by_country',
     'get_customers_by_sales_rep',
+    'get_customer_with_orders',
+    'get_customers_with_order_counts',
     'insert_customer',
+    'insert_customers_bulk',
     'update_customer',
+    'update_customers_bulk',
     'delete_customer',
     
     # Order operations
     'get_all_orders',
+    'iter_all_orders',
     'get_order_by_number',
+    'get_order_summary_by_number',
+    'get_orders_by_numbers',
     'get_orders_by_customer',
     'get_orders_by_status',
     'insert_order',
+    'insert_orders_bulk',
     'update_order_status',
-    'get_order_details'
+    'update_order_statuses_bulk',
+    'get_order_details',
+    
+    # Result cache
+    'release_pending_writes'
 ]
@@ -0,0 +1,124 @@
+"""
+Batching helpers shared by the Data Access Layer.
+Splits large parameter lists into chunks that fit in a single MySQL packet.
+"""
+
+import logging
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.pooling import PooledMySQLConnection
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Fallback used when the server variable cannot be read (MySQL 8.0 default is 64MB,
+# older servers default to 4MB, so stay on the safe side)
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+
+# Headroom left in every packet for the statement text and protocol overhead
+PACKET_HEADROOM = 64 * 1024
+
+# Maximum number of values placed in a single WHERE ... IN (...) list
+IN_LIST_CHUNK_SIZE = 1000
+
+_max_allowed_packet: Optional[int] = None
+
+
+def get_max_allowed_packet(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection]) -> int:
+    """
+    Get the server's max_allowed_packet, queried once and cached for the process.
+
+    Args:
+        connection: Active MySQL connection
+
+    Returns:
+        max_allowed_packet in bytes
+    """
+    global _max_allowed_packet
+    if _max_allowed_packet is not None:
+        return _max_allowed_packet
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT @@max_allowed_packet")
+            row = cursor.fetchone()
+            _max_allowed_packet = int(row[0]) if row else DEFAULT_MAX_ALLOWED_PACKET
+    except Exception as err:
+        logger.warning("Failed to read max_allowed_packet, using default: %s", err)
+        _max_allowed_packet = DEFAULT_MAX_ALLOWED_PACKET
+    return _max_allowed_packet
+
+
+def _estimate_value_size(value: Any) -> int:
+    """Encoded size in bytes of a single value (UTF-8 text can take up to 4 bytes per character)."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(str(value).encode("utf-8"))
+
+
+def _estimate_row_size(row: Sequence) -> int:
+    """Rough size in bytes of a row once rendered into a VALUES tuple."""
+    return sum(_estimate_value_size(value) + 4 for value in row) + 4
+
+
+def chunk_rows(rows: Sequence[Sequence], max_bytes: int) -> Iterator[List[Sequence]]:
+    """
+    Split rows into chunks whose estimated encoded size stays under max_bytes.
+
+    Args:
+        rows: Parameter tuples to split
+        max_bytes: Packet size limit in bytes
+
+    Yields:
+        Lists of rows
+    """
+    budget = max(max_bytes - PACKET_HEADROOM, 1)
+    chunk: List[Sequence] = []
+    size = 0
+
+    for row in rows:
+        row_size = _estimate_row_size(row)
+        if chunk and size + row_size > budget:
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(row)
+        size += row_size
+
+    if chunk:
+        yield chunk
+
+
+def chunk_ids(ids: Iterable[Any], size: int = IN_LIST_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """
+    Deduplicate ids (keeping order) and split them into lists of at most size items.
+
+    Args:
+        ids: Key values to look up
+        size: Maximum number of ids per chunk
+
+    Yields:
+        Lists of ids
+    """
+    unique = list(dict.fromkeys(ids))
+    for start in range(0, len(unique), size):
+        yield unique[start:start + size]
+
+
+def release_streaming_cursor(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                             cursor: Any) -> None:
+    """
+    Discard any rows left on an unbuffered cursor and close it.
+
+    Needed when a streaming iterator is abandoned early: closing an unbuffered
+    cursor with rows still pending fails and leaves the connection unusable.
+
+    Args:
+        connection: MySQL connection the cursor belongs to
+        cursor: Unbuffered cursor to release
+    """
+    try:
+        if connection.unread_result:
+            connection.consume_results()
+        cursor.close()
+    except Exception as err:
+        logger.error("Failed to release streaming cursor: %s", err)
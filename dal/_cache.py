@@ -0,0 +1,204 @@
+"""
+Result cache shared by the Data Access Layer.
+Bounded LRU with a time-to-live for idempotent read-by-id lookups.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+# Defaults for the shared cache
+CACHE_MAX_SIZE = 1024
+CACHE_TTL_SECONDS = 30.0
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ttl seconds after being stored.
+
+    Keys written by a transaction that has not ended yet are marked pending:
+    they are neither served nor stored until flush_pending() is called for the
+    connection (or the connection is garbage collected), so uncommitted rows
+    never reach other callers.
+    """
+
+    def __init__(self, maxsize: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+            ttl: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Keys written by a still-open transaction, per connection
+        self._pending: "WeakKeyDictionary[Any, Set[Hashable]]" = WeakKeyDictionary()
+        # Number of connections holding each pending key, so lookups stay O(1)
+        self._pending_counts: Dict[Hashable, int] = {}
+        # Reentrant: a garbage-collected connection releases its keys from a finalizer,
+        # which may run while this thread already holds the lock
+        self._lock = threading.RLock()
+
+    def _is_pending(self, key: Hashable) -> bool:
+        """Check (with the lock held) whether an open transaction has written key."""
+        return key in self._pending_counts
+
+    def _release_keys(self, keys: Set[Hashable]) -> None:
+        """Drop one pending reference to each key and invalidate it once more."""
+        with self._lock:
+            for key in keys:
+                remaining = self._pending_counts.get(key, 0) - 1
+                if remaining > 0:
+                    self._pending_counts[key] = remaining
+                else:
+                    self._pending_counts.pop(key, None)
+                self._entries.pop(key, None)
+            keys.clear()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key, e.g. ("customers", 103)
+
+        Returns:
+            Cached value or None on a miss, expired entry or pending key
+        """
+        with self._lock:
+            if self._is_pending(key):
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Pending keys are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            if self._is_pending(key):
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Invalidate a single entry (no-op when absent).
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def pop_all(self, keys: Iterable[Hashable]) -> None:
+        """
+        Invalidate several entries (absent keys are ignored).
+
+        Args:
+            keys: Cache keys
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def mark_pending(self, owner: Any, keys: Iterable[Hashable]) -> None:
+        """
+        Invalidate keys written by an open transaction and keep them out of the
+        cache until flush_pending(owner) is called.
+
+        Args:
+            owner: Connection running the transaction
+            keys: Cache keys written
+        """
+        with self._lock:
+            pending = self._pending.get(owner)
+            if pending is None:
+                pending = self._pending[owner] = set()
+                # Connections dropped without flushing must not pin their keys forever
+                weakref.finalize(owner, self._release_keys, pending)
+            for key in keys:
+                self._entries.pop(key, None)
+                if key not in pending:
+                    pending.add(key)
+                    self._pending_counts[key] = self._pending_counts.get(key, 0) + 1
+
+    def flush_pending(self, owner: Any) -> None:
+        """
+        Release the keys marked pending for owner, invalidating them once more.
+
+        Args:
+            owner: Connection whose transaction ended
+        """
+        with self._lock:
+            # The emptied set stays registered, so its finalizer is reused by the next transaction
+            pending = self._pending.get(owner)
+            if pending:
+                self._release_keys(pending)
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache for customer and order rows keyed by (table, primary key)
+cache = TTLCache()
+
+
+
+def invalidate_before_write(connection: Any, keys: Iterable[Hashable], commit: bool) -> None:
+    """
+    Invalidate the keys a DAL mutation is about to write.
+
+    Mutations that commit themselves must call cache.pop_all(keys) again after
+    the commit, dropping any old row a concurrent reader cached in between.
+    Uncommitted writes (commit=False) keep their keys pending until
+    release_pending_writes() is called for the connection.
+
+    Args:
+        connection: Connection performing the write
+        keys: Cache keys written
+        commit: Whether the mutation commits itself
+    """
+    if commit:
+        cache.pop_all(keys)
+    else:
+        cache.mark_pending(connection, keys)
+
+
+def release_pending_writes(connection: Any) -> None:
+    """
+    Let the result cache serve rows written with commit=False on this connection again.
+
+    db.transaction() calls this when it commits or rolls back; callers that
+    manage commit=False writes themselves must call it right after their own
+    commit() or rollback(), otherwise the written rows are not cached until
+    the connection is garbage collected.
+
+    Args:
+        connection: Connection the writes were made on
+    """
+    cache.flush_pending(connection)
@@ -0,0 +1,124 @@
+"""
+Prepared cursor cache shared by the Data Access Layer.
+Keeps one server-side prepared statement per (connection, statement) so hot
+queries are parsed and planned once per connection instead of on every call.
+"""
+
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+import mysql.connector
+from mysql.connector import errorcode
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.pooling import PooledMySQLConnection
+from typing import Any, Optional, Sequence, Tuple, Union
+
+# Maximum number of prepared statements kept open per connection
+MAX_PREPARED_PER_CONNECTION = 32
+
+# Cursors are keyed by the physical connection (the one behind a PooledMySQLConnection,
+# so they survive returning it to the pool and borrowing it again) together with the
+# server session id it had when they were prepared. A reconnect changes the session
+# id and drops the cached cursors; a server-side session reset that keeps the id is
+# caught by execute_prepared(), which re-prepares once on an unknown statement handle.
+_prepared_cursors: "WeakKeyDictionary[Any, Tuple[Optional[int], OrderedDict]]" = WeakKeyDictionary()
+
+
+def _physical_connection(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection]) -> Any:
+    """Unwrap a pooled connection; every borrow hands out a new wrapper around the same connection."""
+    if isinstance(connection, PooledMySQLConnection):
+        return connection._cnx
+    return connection
+
+
+def get_prepared_cursor(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                        sql_key: str) -> Any:
+    """
+    Get the prepared cursor cached for sql_key on this connection, creating it if needed.
+
+    The statement is prepared by the connector on the first execute() and reused
+    while the same SQL is executed again on the cursor.
+
+    Args:
+        connection: Active MySQL connection
+        sql_key: Name identifying the statement
+
+    Returns:
+        Prepared cursor (do not close it, it is owned by the cache)
+    """
+    cnx = _physical_connection(connection)
+    session_id = cnx.connection_id
+    entry = _prepared_cursors.get(cnx)
+    if entry is None or entry[0] != session_id:
+        if entry is not None:
+            for stale in entry[1].values():
+                _close_quietly(stale)
+        entry = (session_id, OrderedDict())
+        _prepared_cursors[cnx] = entry
+    cursors = entry[1]
+
+    cursor = cursors.get(sql_key)
+    if cursor is not None:
+        cursors.move_to_end(sql_key)
+        return cursor
+
+    cursor = cnx.cursor(prepared=True)
+    cursors[sql_key] = cursor
+
+    if len(cursors) > MAX_PREPARED_PER_CONNECTION:
+        _, evicted = cursors.popitem(last=False)
+        _close_quietly(evicted)
+
+    return cursor
+
+
+def execute_prepared(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                     sql_key: str, sql: str, params: Sequence[Any]) -> Any:
+    """
+    Execute sql on the cached prepared cursor for sql_key.
+
+    If the server no longer knows the statement handle (e.g. after a session
+    reset), the cursor is dropped and the statement is prepared again once.
+
+    Args:
+        connection: Active MySQL connection
+        sql_key: Name identifying the statement
+        sql: Statement text
+        params: Statement parameters
+
+    Returns:
+        The cursor the statement was executed on, ready for fetching
+    """
+    cursor = get_prepared_cursor(connection, sql_key)
+    try:
+        cursor.execute(sql, params)
+    except mysql.connector.Error as err:
+        if err.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+            raise
+        forget_prepared_cursor(connection, sql_key)
+        cursor = get_prepared_cursor(connection, sql_key)
+        cursor.execute(sql, params)
+    return cursor
+
+
+def forget_prepared_cursor(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                           sql_key: str) -> None:
+    """
+    Drop a cached prepared cursor, e.g. after it failed, so the next call prepares afresh.
+
+    Args:
+        connection: MySQL connection the cursor belongs to
+        sql_key: Name identifying the statement
+    """
+    entry = _prepared_cursors.get(_physical_connection(connection))
+    if entry is not None:
+        cursor = entry[1].pop(sql_key, None)
+        if cursor is not None:
+            _close_quietly(cursor)
+
+
+def _close_quietly(cursor: Any) -> None:
+    """Close a cursor, ignoring errors from an already broken connection."""
+    try:
+        cursor.close()
+    except Exception:
+        pass
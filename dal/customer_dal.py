@@ -3,9 +3,106 @@ Customer Data Access Layer.
 Handles all database operations related to customers table.
 """
 
+import logging
+from functools import lru_cache
 from mysql.connector.abstracts import MySQLConnectionAbstract
 from mysql.connector.pooling import PooledMySQLConnection
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
+from ._batching import get_max_allowed_packet, chunk_rows, chunk_ids, release_streaming_cursor
+from ._prepared import execute_prepared, forget_prepared_cursor
+from ._cache import cache, invalidate_before_write
+
+logger = logging.getLogger(__name__)
+
+# Column projections: full row for detail views, summary for lean callers
+_CUSTOMER_FULL_COLS = (
+    "customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, addressLine1, addressLine2, city, state, postalCode, "
+    "country, salesRepEmployeeNumber, creditLimit"
+)
+
+_CUSTOMER_SUMMARY_COLS = "customerNumber, customerName, contactLastName, contactFirstName, city, country"
+
+# Columns update_customer / update_customers_bulk may set (column names cannot be parameterized)
+_ALLOWED_CUSTOMER_COLUMNS = frozenset({
+    "customerName", "contactLastName", "contactFirstName", "phone",
+    "addressLine1", "addressLine2", "city", "state", "postalCode",
+    "country", "salesRepEmployeeNumber", "creditLimit",
+})
+
+# SQL statements, built once at import as single-line strings
+_SQL_GET_ALL_CUSTOMERS = (
+    "SELECT customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, addressLine1, city, country, salesRepEmployeeNumber, creditLimit "
+    "FROM customers "
+    "ORDER BY customerName "
+    "LIMIT %s"
+)
+
+_SQL_ITER_ALL_CUSTOMERS = (
+    "SELECT customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, addressLine1, city, country, salesRepEmployeeNumber, creditLimit "
+    "FROM customers "
+    "ORDER BY customerName"
+)
+
+_SQL_GET_CUSTOMER_BY_NUMBER = f"SELECT {_CUSTOMER_FULL_COLS} FROM customers WHERE customerNumber = %s"
+
+_SQL_GET_CUSTOMER_SUMMARY_BY_NUMBER = f"SELECT {_CUSTOMER_SUMMARY_COLS} FROM customers WHERE customerNumber = %s"
+
+_SQL_GET_CUSTOMERS_BY_NUMBERS = (
+    f"SELECT {_CUSTOMER_FULL_COLS} FROM customers "
+    "WHERE customerNumber IN ({placeholders})"
+)
+
+_SQL_GET_CUSTOMERS_BY_COUNTRY = (
+    "SELECT customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, city, country "
+    "FROM customers "
+    "WHERE country = %s "
+    "ORDER BY customerName"
+)
+
+_SQL_GET_CUSTOMERS_BY_SALES_REP = (
+    "SELECT customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, city, country, creditLimit "
+    "FROM customers "
+    "WHERE salesRepEmployeeNumber = %s "
+    "ORDER BY customerName"
+)
+
+_SQL_GET_CUSTOMER_WITH_ORDERS = (
+    "SELECT c.customerNumber, c.customerName, c.contactLastName, c.contactFirstName, "
+    "c.phone, c.city, c.country, "
+    "o.orderNumber, o.orderDate, o.status "
+    "FROM customers c "
+    "LEFT JOIN orders o ON o.customerNumber = c.customerNumber "
+    "WHERE c.customerNumber = %s "
+    "ORDER BY o.orderDate DESC"
+)
+
+_SQL_GET_CUSTOMERS_WITH_ORDER_COUNTS = (
+    "SELECT c.customerNumber, c.customerName, c.city, c.country, "
+    "COUNT(o.orderNumber) AS orderCount "
+    "FROM customers c "
+    "LEFT JOIN orders o ON o.customerNumber = c.customerNumber "
+    "GROUP BY c.customerNumber, c.customerName, c.city, c.country "
+    "ORDER BY c.customerName "
+    "LIMIT %s"
+)
+
+_SQL_INSERT_CUSTOMER = (
+    "INSERT INTO customers "
+    "(customerNumber, customerName, contactLastName, contactFirstName, "
+    "phone, addressLine1, city, country, salesRepEmployeeNumber, creditLimit) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+
+_SQL_UPDATE_CUSTOMER = "UPDATE customers SET {set_clause} WHERE customerNumber = %s"
+
+_SQL_UPDATE_CUSTOMERS_BULK = "UPDATE customers SET {assignments} WHERE customerNumber IN ({placeholders})"
+
+_SQL_DELETE_CUSTOMER = "DELETE FROM customers WHERE customerNumber = %s"
 
 
 def get_all_customers(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
@@ -20,55 +117,146 @@ def get_all_customers(connection: Union[MySQLConnectionAbstract, PooledMySQLConn
     Returns:
         List of customer tuples
     """
-    query = '''
-    SELECT customerNumber, customerName, contactLastName, contactFirstName, 
-           phone, addressLine1, city, country, salesRepEmployeeNumber, creditLimit
-    FROM customers
-    ORDER BY customerName
-    LIMIT %s
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (limit,))
+            cursor.execute(_SQL_GET_ALL_CUSTOMERS, (limit,))
             rows = cursor.fetchall()
-            print(f"Retrieved {len(rows)} customers")
+            logger.debug("Retrieved %d customers", len(rows))
             return rows
     except Exception as err:
-        print(f"Failed to query customers: {err}")
+        logger.error("Failed to query customers: %s", err)
         return []
 
 
+def iter_all_customers(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                       batch_size: int = 1000) -> Iterator[Any]:
+    """
+    Stream all customers without materializing the whole result set.
+    
+    Rows are read from an unbuffered cursor in batches of batch_size, so memory
+    stays proportional to the batch. The connection cannot run other queries
+    until the iterator is exhausted or closed; closing it early discards the
+    remaining rows so the connection can be reused.
+    
+    Args:
+        connection: Active MySQL connection
+        batch_size: Number of rows fetched per fetchmany() call
+        
+    Yields:
+        Customer tuples
+        
+    Raises:
+        mysql.connector.Error: If the query or a fetch fails, so a failed read is
+                               not mistaken for the end of the table
+    """
+    cursor = connection.cursor(buffered=False)
+    try:
+        cursor.execute(_SQL_ITER_ALL_CUSTOMERS)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    except Exception as err:
+        logger.error("Failed to stream customers: %s", err)
+        raise
+    finally:
+        # Also runs on GeneratorExit when the caller stops early
+        release_streaming_cursor(connection, cursor)
+
+
 def get_customer_by_number(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
-                           customer_number: int) -> Optional[Any]:
+                           customer_number: int, use_cache: bool = True) -> Optional[Any]:
     """
     Get a customer by customer number.
     
+    Found rows are cached for a short time; update_customer and delete_customer
+    invalidate the entry.
+    
     Args:
         connection: Active MySQL connection
         customer_number: Customer number
+        use_cache: Serve from / populate the result cache (default: True)
         
     Returns:
         Customer tuple or None if not found
     """
-    query = '''
-    SELECT customerNumber, customerName, contactLastName, contactFirstName, 
-           phone, addressLine1, addressLine2, city, state, postalCode, 
-           country, salesRepEmployeeNumber, creditLimit
-    FROM customers
-    WHERE customerNumber = %s
-    '''
+    key = ("customers", customer_number)
+    if use_cache:
+        row = cache.get(key)
+        if row is not None:
+            return row
     
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(query, (customer_number,))
-            row = cursor.fetchone()
-            return row
+        cursor = execute_prepared(connection, "customer_by_number",
+                                  _SQL_GET_CUSTOMER_BY_NUMBER, (customer_number,))
+        rows = cursor.fetchall()
+        row = rows[0] if rows else None
+        if use_cache and row is not None:
+            cache.set(key, row)
+        return row
     except Exception as err:
-        print(f"Failed to query customer: {err}")
+        logger.error("Failed to query customer: %s", err)
+        forget_prepared_cursor(connection, "customer_by_number")
         return None
 
 
+def get_customer_summary_by_number(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                                   customer_number: int) -> Optional[Any]:
+    """
+    Get the summary columns of a customer by customer number.
+    
+    Lean variant of get_customer_by_number for callers that only show who and
+    where the customer is.
+    
+    Args:
+        connection: Active MySQL connection
+        customer_number: Customer number
+        
+    Returns:
+        Tuple (customerNumber, customerName, contactLastName, contactFirstName,
+        city, country) or None if not found
+    """
+    try:
+        cursor = execute_prepared(connection, "customer_summary_by_number",
+                                  _SQL_GET_CUSTOMER_SUMMARY_BY_NUMBER, (customer_number,))
+        rows = cursor.fetchall()
+        return rows[0] if rows else None
+    except Exception as err:
+        logger.error("Failed to query customer summary: %s", err)
+        forget_prepared_cursor(connection, "customer_summary_by_number")
+        return None
+
+
+def get_customers_by_numbers(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                             customer_numbers: List[int]) -> Dict[int, Any]:
+    """
+    Get several customers at once using WHERE ... IN (...) instead of one query per id.
+    
+    Args:
+        connection: Active MySQL connection
+        customer_numbers: Customer numbers to fetch
+        
+    Returns:
+        Dictionary mapping customerNumber to customer tuple (missing ids are omitted)
+    """
+    customers = {}
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_ids(customer_numbers):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                query = _SQL_GET_CUSTOMERS_BY_NUMBERS.format(placeholders=placeholders)
+                cursor.execute(query, tuple(chunk))
+                for row in cursor.fetchall():
+                    customers[row[0]] = row
+            logger.debug("Retrieved %d customers by number", len(customers))
+            return customers
+    except Exception as err:
+        logger.error("Failed to query customers by numbers: %s", err)
+        return {}
+
+
 def get_customers_by_country(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
                              country: str) -> List[Any]:
     """
@@ -81,22 +269,14 @@ def get_customers_by_country(connection: Union[MySQLConnectionAbstract, PooledMy
     Returns:
         List of customer tuples
     """
-    query = '''
-    SELECT customerNumber, customerName, contactLastName, contactFirstName, 
-           phone, city, country
-    FROM customers
-    WHERE country = %s
-    ORDER BY customerName
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (country,))
+            cursor.execute(_SQL_GET_CUSTOMERS_BY_COUNTRY, (country,))
             rows = cursor.fetchall()
-            print(f"Found {len(rows)} customers in {country}")
+            logger.debug("Found %d customers in %s", len(rows), country)
             return rows
     except Exception as err:
-        print(f"Failed to query customers by country: {err}")
+        logger.error("Failed to query customers by country: %s", err)
         return []
 
 
@@ -112,22 +292,65 @@ def get_customers_by_sales_rep(connection: Union[MySQLConnectionAbstract, Pooled
     Returns:
         List of customer tuples
     """
-    query = '''
-    SELECT customerNumber, customerName, contactLastName, contactFirstName, 
-           phone, city, country, creditLimit
-    FROM customers
-    WHERE salesRepEmployeeNumber = %s
-    ORDER BY customerName
-    '''
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(_SQL_GET_CUSTOMERS_BY_SALES_REP, (employee_number,))
+            rows = cursor.fetchall()
+            logger.debug("Found %d customers for sales rep %s", len(rows), employee_number)
+            return rows
+    except Exception as err:
+        logger.error("Failed to query customers by sales rep: %s", err)
+        return []
+
+
+def get_customer_with_orders(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                             customer_number: int) -> List[Any]:
+    """
+    Get a customer together with all of their orders in a single query.
     
+    One row is returned per order; a customer without orders yields a single
+    row whose order columns are None.
+    
+    Args:
+        connection: Active MySQL connection
+        customer_number: Customer number
+        
+    Returns:
+        List of tuples (customerNumber, customerName, contactLastName, contactFirstName,
+        phone, city, country, orderNumber, orderDate, status)
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(_SQL_GET_CUSTOMER_WITH_ORDERS, (customer_number,))
+            rows = cursor.fetchall()
+            order_count = sum(1 for row in rows if row[7] is not None)
+            logger.debug("Retrieved customer %s with %d orders", customer_number, order_count)
+            return rows
+    except Exception as err:
+        logger.error("Failed to query customer with orders: %s", err)
+        return []
+
+
+def get_customers_with_order_counts(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                                    limit: int = 100) -> List[Any]:
+    """
+    Get customers with their number of orders, aggregated on the server.
+    
+    Args:
+        connection: Active MySQL connection
+        limit: Maximum number of rows to return
+        
+    Returns:
+        List of tuples (customerNumber, customerName, city, country, orderCount)
+    """
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (employee_number,))
+            cursor.execute(_SQL_GET_CUSTOMERS_WITH_ORDER_COUNTS, (limit,))
             rows = cursor.fetchall()
-            print(f"Found {len(rows)} customers for sales rep {employee_number}")
+            logger.debug("Retrieved order counts for %d customers", len(rows))
             return rows
     except Exception as err:
-        print(f"Failed to query customers by sales rep: {err}")
+        logger.error("Failed to query customer order counts: %s", err)
         return []
 
 
@@ -135,7 +358,7 @@ def insert_customer(connection: Union[MySQLConnectionAbstract, PooledMySQLConnec
                    customer_number: int, customer_name: str, contact_last_name: str,
                    contact_first_name: str, phone: str, address_line1: str,
                    city: str, country: str, sales_rep: Optional[int] = None,
-                   credit_limit: Optional[float] = None) -> bool:
+                   credit_limit: Optional[float] = None, commit: bool = True) -> bool:
     """
     Insert a new customer.
     
@@ -151,93 +374,247 @@ def insert_customer(connection: Union[MySQLConnectionAbstract, PooledMySQLConnec
         country: Country
         sales_rep: Sales representative employee number (optional)
         credit_limit: Credit limit (optional)
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
         
     Returns:
         True if successful, False otherwise
     """
-    query = '''
-    INSERT INTO customers 
-    (customerNumber, customerName, contactLastName, contactFirstName, 
-     phone, addressLine1, city, country, salesRepEmployeeNumber, creditLimit)
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    '''
+    keys = [("customers", customer_number)]
+    invalidate_before_write(connection, keys, commit)
     
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(query, (customer_number, customer_name, contact_last_name,
-                                 contact_first_name, phone, address_line1, city,
-                                 country, sales_rep, credit_limit))
+        cursor = execute_prepared(connection, "insert_customer", _SQL_INSERT_CUSTOMER,
+                                  (customer_number, customer_name, contact_last_name,
+                                   contact_first_name, phone, address_line1, city,
+                                   country, sales_rep, credit_limit))
+        if commit:
             connection.commit()
-            print(f"Customer {customer_number} inserted successfully")
-            return True
+            cache.pop_all(keys)
+        logger.debug("Customer %s inserted successfully", customer_number)
+        return True
     except Exception as err:
-        print(f"Failed to insert customer: {err}")
+        logger.error("Failed to insert customer: %s", err)
+        forget_prepared_cursor(connection, "insert_customer")
+        if not commit:
+            raise
         connection.rollback()
         return False
 
 
+def insert_customers_bulk(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                          rows: List[tuple], commit: bool = True) -> int:
+    """
+    Insert many customers in a single transaction.
+    
+    The connector rewrites executemany() on an INSERT ... VALUES statement into
+    one multi-row INSERT, so each chunk costs a single round trip. Rows are
+    chunked so every statement stays under the server's max_allowed_packet.
+    
+    Args:
+        connection: Active MySQL connection
+        rows: Tuples in insert_customer argument order (customer_number, customer_name,
+              contact_last_name, contact_first_name, phone, address_line1, city,
+              country, sales_rep, credit_limit)
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
+        
+    Returns:
+        Number of inserted rows (0 on failure, the whole batch is rolled back)
+    """
+    if not rows:
+        return 0
+    
+    keys = [("customers", row[0]) for row in rows]
+    invalidate_before_write(connection, keys, commit)
+    max_packet = get_max_allowed_packet(connection)
+    inserted = 0
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_rows(rows, max_packet):
+                cursor.executemany(_SQL_INSERT_CUSTOMER, chunk)
+                inserted += cursor.rowcount
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
+            logger.debug("Inserted %d customers", inserted)
+            return inserted
+    except Exception as err:
+        logger.error("Failed to bulk insert customers: %s", err)
+        if not commit:
+            raise
+        connection.rollback()
+        return 0
+
+
+@lru_cache(maxsize=64)
+def _update_customer_sql(columns: Tuple[str, ...]) -> str:
+    """Build (once per column set) the UPDATE statement for update_customer."""
+    set_clause = ", ".join(f"{column} = %s" for column in columns)
+    return _SQL_UPDATE_CUSTOMER.format(set_clause=set_clause)
+
+
 def update_customer(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
-                   customer_number: int, **kwargs) -> bool:
+                   customer_number: int, *, commit: bool = True, **kwargs) -> bool:
     """
     Update customer information.
     
     Args:
         connection: Active MySQL connection
         customer_number: Customer number to update
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
         **kwargs: Fields to update (customerName, phone, creditLimit, etc.)
         
     Returns:
         True if successful, False otherwise
+        
+    Raises:
+        ValueError: If a field is not an updatable customer column, or if no
+                    fields are given with commit=False (so transaction() rolls back)
     """
     if not kwargs:
-        print("No fields to update")
+        if not commit:
+            raise ValueError("No fields to update")
+        logger.warning("No fields to update")
         return False
     
-    set_clause = ", ".join([f"{key} = %s" for key in kwargs.keys()])
-    query = f"UPDATE customers SET {set_clause} WHERE customerNumber = %s"
-    values = list(kwargs.values()) + [customer_number]
+    invalid = kwargs.keys() - _ALLOWED_CUSTOMER_COLUMNS
+    if invalid:
+        raise ValueError(f"Cannot update unknown customer fields: {', '.join(sorted(invalid))}")
+    
+    # Sorted so the same field set always maps to the same statement and prepared cursor
+    columns = tuple(sorted(kwargs))
+    query = _update_customer_sql(columns)
+    values = (*(kwargs[column] for column in columns), customer_number)
+    sql_key = "update_customer:" + ",".join(columns)
+    keys = [("customers", customer_number)]
+    invalidate_before_write(connection, keys, commit)
     
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(query, values)
+        cursor = execute_prepared(connection, sql_key, query, values)
+        if commit:
             connection.commit()
-            if cursor.rowcount > 0:
-                print(f"Customer {customer_number} updated successfully")
-                return True
-            else:
-                print(f"No customer found with number {customer_number}")
-                return False
+            cache.pop_all(keys)
+        if cursor.rowcount > 0:
+            logger.debug("Customer %s updated successfully", customer_number)
+            return True
+        else:
+            logger.warning("No customer found with number %s", customer_number)
+            return False
     except Exception as err:
-        print(f"Failed to update customer: {err}")
+        logger.error("Failed to update customer: %s", err)
+        forget_prepared_cursor(connection, sql_key)
+        if not commit:
+            raise
         connection.rollback()
         return False
 
 
+def update_customers_bulk(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                          updates: List[Tuple[int, Dict[str, Any]]],
+                          commit: bool = True) -> int:
+    """
+    Apply many customer updates in one statement.
+    
+    Updates are merged into UPDATE ... SET field = CASE customerNumber WHEN ... ELSE field END
+    WHERE customerNumber IN (...), with one CASE per field present in any update and
+    one statement per chunk of 1000 customers.
+    
+    Args:
+        connection: Active MySQL connection
+        updates: Pairs of (customer_number, {field: value}) using the same field names
+                 as update_customer; updates for the same customer are merged
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
+        
+    Returns:
+        Number of updated rows (0 on failure, all chunks are rolled back)
+        
+    Raises:
+        ValueError: If a field is not an updatable customer column
+    """
+    merged: Dict[int, Dict[str, Any]] = {}
+    for customer_number, fields in updates:
+        if fields:
+            merged.setdefault(customer_number, {}).update(fields)
+    if not merged:
+        logger.warning("No fields to update")
+        return 0
+    
+    invalid = {field for fields in merged.values() for field in fields} - _ALLOWED_CUSTOMER_COLUMNS
+    if invalid:
+        raise ValueError(f"Cannot update unknown customer fields: {', '.join(sorted(invalid))}")
+    
+    keys = [("customers", customer_number) for customer_number in merged]
+    invalidate_before_write(connection, keys, commit)
+    
+    updated = 0
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_ids(merged):
+                columns = list(dict.fromkeys(field for number in chunk for field in merged[number]))
+                assignments = []
+                params: List[Any] = []
+                for column in columns:
+                    whens = []
+                    for number in chunk:
+                        if column in merged[number]:
+                            whens.append("WHEN %s THEN %s")
+                            params.extend((number, merged[number][column]))
+                    assignments.append(f"{column} = CASE customerNumber {' '.join(whens)} ELSE {column} END")
+                placeholders = ", ".join(["%s"] * len(chunk))
+                query = _SQL_UPDATE_CUSTOMERS_BULK.format(assignments=", ".join(assignments),
+                                                          placeholders=placeholders)
+                cursor.execute(query, (*params, *chunk))
+                updated += cursor.rowcount
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
+            logger.debug("Updated %d customers", updated)
+            return updated
+    except Exception as err:
+        logger.error("Failed to bulk update customers: %s", err)
+        if not commit:
+            raise
+        connection.rollback()
+        return 0
+
+
 def delete_customer(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
-                   customer_number: int) -> bool:
+                   customer_number: int, commit: bool = True) -> bool:
     """
     Delete a customer.
     
     Args:
         connection: Active MySQL connection
         customer_number: Customer number to delete
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
         
     Returns:
         True if successful, False otherwise
     """
-    query = "DELETE FROM customers WHERE customerNumber = %s"
+    keys = [("customers", customer_number)]
+    invalidate_before_write(connection, keys, commit)
     
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (customer_number,))
-            connection.commit()
+            cursor.execute(_SQL_DELETE_CUSTOMER, (customer_number,))
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
             if cursor.rowcount > 0:
-                print(f"Customer {customer_number} deleted successfully")
+                logger.debug("Customer %s deleted successfully", customer_number)
                 return True
             else:
-                print(f"No customer found with number {customer_number}")
+                logger.warning("No customer found with number %s", customer_number)
                 return False
     except Exception as err:
-        print(f"Failed to delete customer: {err}")
+        logger.error("Failed to delete customer: %s", err)
+        if not commit:
+            raise
         connection.rollback()
         return False
@@ -3,10 +3,78 @@ Order Data Access Layer.
 Handles all database operations related to orders and orderdetails tables.
 """
 
+import logging
 from mysql.connector.abstracts import MySQLConnectionAbstract
 from mysql.connector.pooling import PooledMySQLConnection
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from datetime import date
+from ._batching import get_max_allowed_packet, chunk_rows, chunk_ids, release_streaming_cursor
+from ._prepared import execute_prepared, forget_prepared_cursor
+from ._cache import cache, invalidate_before_write
+
+logger = logging.getLogger(__name__)
+
+# Column projections: full row for detail views, summary for lean callers
+_ORDER_FULL_COLS = "orderNumber, orderDate, requiredDate, shippedDate, status, comments, customerNumber"
+
+_ORDER_SUMMARY_COLS = "orderNumber, orderDate, status, customerNumber"
+
+# SQL statements, built once at import as single-line strings
+_SQL_GET_ALL_ORDERS = (
+    "SELECT orderNumber, orderDate, requiredDate, shippedDate, "
+    "status, customerNumber "
+    "FROM orders "
+    "ORDER BY orderDate DESC "
+    "LIMIT %s"
+)
+
+_SQL_ITER_ALL_ORDERS = (
+    "SELECT orderNumber, orderDate, requiredDate, shippedDate, "
+    "status, customerNumber "
+    "FROM orders "
+    "ORDER BY orderDate DESC"
+)
+
+_SQL_GET_ORDER_BY_NUMBER = f"SELECT {_ORDER_FULL_COLS} FROM orders WHERE orderNumber = %s"
+
+_SQL_GET_ORDER_SUMMARY_BY_NUMBER = f"SELECT {_ORDER_SUMMARY_COLS} FROM orders WHERE orderNumber = %s"
+
+_SQL_GET_ORDERS_BY_NUMBERS = f"SELECT {_ORDER_FULL_COLS} FROM orders WHERE orderNumber IN ({{placeholders}})"
+
+_SQL_GET_ORDERS_BY_CUSTOMER = (
+    "SELECT orderNumber, orderDate, requiredDate, shippedDate, status "
+    "FROM orders "
+    "WHERE customerNumber = %s "
+    "ORDER BY orderDate DESC"
+)
+
+_SQL_GET_ORDERS_BY_STATUS = (
+    "SELECT orderNumber, orderDate, requiredDate, shippedDate, "
+    "customerNumber, status "
+    "FROM orders "
+    "WHERE status = %s "
+    "ORDER BY orderDate DESC"
+)
+
+_SQL_INSERT_ORDER = (
+    "INSERT INTO orders (orderNumber, orderDate, requiredDate, customerNumber, status) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+
+_SQL_UPDATE_ORDER_STATUS = "UPDATE orders SET status = %s WHERE orderNumber = %s"
+
+_SQL_UPDATE_ORDER_STATUS_SHIPPED = "UPDATE orders SET status = %s, shippedDate = %s WHERE orderNumber = %s"
+
+_SQL_UPDATE_ORDER_STATUSES_BULK = "UPDATE orders SET {assignments} WHERE orderNumber IN ({placeholders})"
+
+_SQL_GET_ORDER_DETAILS = (
+    "SELECT od.orderNumber, od.productCode, p.productName, "
+    "od.quantityOrdered, od.priceEach, od.orderLineNumber "
+    "FROM orderdetails od "
+    "JOIN products p ON od.productCode = p.productCode "
+    "WHERE od.orderNumber = %s "
+    "ORDER BY od.orderLineNumber"
+)
 
 
 def get_all_orders(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
@@ -21,54 +89,144 @@ def get_all_orders(connection: Union[MySQLConnectionAbstract, PooledMySQLConnect
     Returns:
         List of order tuples
     """
-    query = '''
-    SELECT orderNumber, orderDate, requiredDate, shippedDate, 
-           status, customerNumber
-    FROM orders
-    ORDER BY orderDate DESC
-    LIMIT %s
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (limit,))
+            cursor.execute(_SQL_GET_ALL_ORDERS, (limit,))
             rows = cursor.fetchall()
-            print(f"Retrieved {len(rows)} orders")
+            logger.debug("Retrieved %d orders", len(rows))
             return rows
     except Exception as err:
-        print(f"Failed to query orders: {err}")
+        logger.error("Failed to query orders: %s", err)
         return []
 
 
+def iter_all_orders(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                    batch_size: int = 1000) -> Iterator[Any]:
+    """
+    Stream all orders without materializing the whole result set.
+    
+    Rows are read from an unbuffered cursor in batches of batch_size, so memory
+    stays proportional to the batch. The connection cannot run other queries
+    until the iterator is exhausted or closed; closing it early discards the
+    remaining rows so the connection can be reused.
+    
+    Args:
+        connection: Active MySQL connection
+        batch_size: Number of rows fetched per fetchmany() call
+        
+    Yields:
+        Order tuples
+        
+    Raises:
+        mysql.connector.Error: If the query or a fetch fails, so a failed read is
+                               not mistaken for the end of the table
+    """
+    cursor = connection.cursor(buffered=False)
+    try:
+        cursor.execute(_SQL_ITER_ALL_ORDERS)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    except Exception as err:
+        logger.error("Failed to stream orders: %s", err)
+        raise
+    finally:
+        # Also runs on GeneratorExit when the caller stops early
+        release_streaming_cursor(connection, cursor)
+
+
 def get_order_by_number(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
-                       order_number: int) -> Optional[Any]:
+                       order_number: int, use_cache: bool = True) -> Optional[Any]:
     """
     Get an order by order number.
     
+    Found rows are cached for a short time; update_order_status invalidates the entry.
+    
     Args:
         connection: Active MySQL connection
         order_number: Order number
+        use_cache: Serve from / populate the result cache (default: True)
         
     Returns:
         Order tuple or None if not found
     """
-    query = '''
-    SELECT orderNumber, orderDate, requiredDate, shippedDate, 
-           status, comments, customerNumber
-    FROM orders
-    WHERE orderNumber = %s
-    '''
+    key = ("orders", order_number)
+    if use_cache:
+        row = cache.get(key)
+        if row is not None:
+            return row
     
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(query, (order_number,))
-            row = cursor.fetchone()
-            return row
+        cursor = execute_prepared(connection, "order_by_number",
+                                  _SQL_GET_ORDER_BY_NUMBER, (order_number,))
+        rows = cursor.fetchall()
+        row = rows[0] if rows else None
+        if use_cache and row is not None:
+            cache.set(key, row)
+        return row
+    except Exception as err:
+        logger.error("Failed to query order: %s", err)
+        forget_prepared_cursor(connection, "order_by_number")
+        return None
+
+
+def get_order_summary_by_number(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                                order_number: int) -> Optional[Any]:
+    """
+    Get the summary columns of an order by order number.
+    
+    Lean variant of get_order_by_number that skips the dates and comments
+    most callers do not display.
+    
+    Args:
+        connection: Active MySQL connection
+        order_number: Order number
+        
+    Returns:
+        Tuple (orderNumber, orderDate, status, customerNumber) or None if not found
+    """
+    try:
+        cursor = execute_prepared(connection, "order_summary_by_number",
+                                  _SQL_GET_ORDER_SUMMARY_BY_NUMBER, (order_number,))
+        rows = cursor.fetchall()
+        return rows[0] if rows else None
     except Exception as err:
-        print(f"Failed to query order: {err}")
+        logger.error("Failed to query order summary: %s", err)
+        forget_prepared_cursor(connection, "order_summary_by_number")
         return None
 
 
+def get_orders_by_numbers(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                          order_numbers: List[int]) -> Dict[int, Any]:
+    """
+    Get several orders at once using WHERE ... IN (...) instead of one query per id.
+    
+    Args:
+        connection: Active MySQL connection
+        order_numbers: Order numbers to fetch
+        
+    Returns:
+        Dictionary mapping orderNumber to order tuple (missing ids are omitted)
+    """
+    orders = {}
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_ids(order_numbers):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                query = _SQL_GET_ORDERS_BY_NUMBERS.format(placeholders=placeholders)
+                cursor.execute(query, tuple(chunk))
+                for row in cursor.fetchall():
+                    orders[row[0]] = row
+            logger.debug("Retrieved %d orders by number", len(orders))
+            return orders
+    except Exception as err:
+        logger.error("Failed to query orders by numbers: %s", err)
+        return {}
+
+
 def get_orders_by_customer(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
                           customer_number: int) -> List[Any]:
     """
@@ -81,21 +239,14 @@ def get_orders_by_customer(connection: Union[MySQLConnectionAbstract, PooledMySQ
     Returns:
         List of order tuples
     """
-    query = '''
-    SELECT orderNumber, orderDate, requiredDate, shippedDate, status
-    FROM orders
-    WHERE customerNumber = %s
-    ORDER BY orderDate DESC
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (customer_number,))
+            cursor.execute(_SQL_GET_ORDERS_BY_CUSTOMER, (customer_number,))
             rows = cursor.fetchall()
-            print(f"Found {len(rows)} orders for customer {customer_number}")
+            logger.debug("Found %d orders for customer %s", len(rows), customer_number)
             return rows
     except Exception as err:
-        print(f"Failed to query orders by customer: {err}")
+        logger.error("Failed to query orders by customer: %s", err)
         return []
 
 
@@ -111,28 +262,21 @@ def get_orders_by_status(connection: Union[MySQLConnectionAbstract, PooledMySQLC
     Returns:
         List of order tuples
     """
-    query = '''
-    SELECT orderNumber, orderDate, requiredDate, shippedDate, 
-           customerNumber, status
-    FROM orders
-    WHERE status = %s
-    ORDER BY orderDate DESC
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (status,))
+            cursor.execute(_SQL_GET_ORDERS_BY_STATUS, (status,))
             rows = cursor.fetchall()
-            print(f"Found {len(rows)} orders with status '{status}'")
+            logger.debug("Found %d orders with status '%s'", len(rows), status)
             return rows
     except Exception as err:
-        print(f"Failed to query orders by status: {err}")
+        logger.error("Failed to query orders by status: %s", err)
         return []
 
 
 def insert_order(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
                 order_number: int, order_date: date, required_date: date,
-                customer_number: int, status: str = "In Process") -> bool:
+                customer_number: int, status: str = "In Process",
+                commit: bool = True) -> bool:
     """
     Insert a new order.
     
@@ -143,31 +287,80 @@ def insert_order(connection: Union[MySQLConnectionAbstract, PooledMySQLConnectio
         required_date: Required date
         customer_number: Customer number
         status: Order status (default: In Process)
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
         
     Returns:
         True if successful, False otherwise
     """
-    query = '''
-    INSERT INTO orders (orderNumber, orderDate, requiredDate, customerNumber, status)
-    VALUES (%s, %s, %s, %s, %s)
-    '''
+    keys = [("orders", order_number)]
+    invalidate_before_write(connection, keys, commit)
     
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(query, (order_number, order_date, required_date,
-                                 customer_number, status))
+        cursor = execute_prepared(connection, "insert_order", _SQL_INSERT_ORDER,
+                                  (order_number, order_date, required_date,
+                                   customer_number, status))
+        if commit:
             connection.commit()
-            print(f"Order {order_number} inserted successfully")
-            return True
+            cache.pop_all(keys)
+        logger.debug("Order %s inserted successfully", order_number)
+        return True
     except Exception as err:
-        print(f"Failed to insert order: {err}")
+        logger.error("Failed to insert order: %s", err)
+        forget_prepared_cursor(connection, "insert_order")
+        if not commit:
+            raise
         connection.rollback()
         return False
 
 
+def insert_orders_bulk(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                       rows: List[tuple], commit: bool = True) -> int:
+    """
+    Insert many orders in a single transaction.
+    
+    The connector rewrites executemany() on an INSERT ... VALUES statement into
+    one multi-row INSERT, so each chunk costs a single round trip. Rows are
+    chunked so every statement stays under the server's max_allowed_packet.
+    
+    Args:
+        connection: Active MySQL connection
+        rows: Tuples of (order_number, order_date, required_date, customer_number, status)
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
+        
+    Returns:
+        Number of inserted rows (0 on failure, the whole batch is rolled back)
+    """
+    if not rows:
+        return 0
+    
+    keys = [("orders", row[0]) for row in rows]
+    invalidate_before_write(connection, keys, commit)
+    max_packet = get_max_allowed_packet(connection)
+    inserted = 0
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_rows(rows, max_packet):
+                cursor.executemany(_SQL_INSERT_ORDER, chunk)
+                inserted += cursor.rowcount
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
+            logger.debug("Inserted %d orders", inserted)
+            return inserted
+    except Exception as err:
+        logger.error("Failed to bulk insert orders: %s", err)
+        if not commit:
+            raise
+        connection.rollback()
+        return 0
+
+
 def update_order_status(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
                        order_number: int, status: str, 
-                       shipped_date: Optional[date] = None) -> bool:
+                       shipped_date: Optional[date] = None, commit: bool = True) -> bool:
     """
     Update order status and optionally shipped date.
     
@@ -176,33 +369,106 @@ def update_order_status(connection: Union[MySQLConnectionAbstract, PooledMySQLCo
         order_number: Order number
         status: New status
         shipped_date: Shipped date (optional)
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
         
     Returns:
         True if successful, False otherwise
     """
     if shipped_date:
-        query = "UPDATE orders SET status = %s, shippedDate = %s WHERE orderNumber = %s"
+        query = _SQL_UPDATE_ORDER_STATUS_SHIPPED
         values = (status, shipped_date, order_number)
     else:
-        query = "UPDATE orders SET status = %s WHERE orderNumber = %s"
+        query = _SQL_UPDATE_ORDER_STATUS
         values = (status, order_number)
+    keys = [("orders", order_number)]
+    invalidate_before_write(connection, keys, commit)
     
     try:
         with connection.cursor() as cursor:
             cursor.execute(query, values)
-            connection.commit()
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
             if cursor.rowcount > 0:
-                print(f"Order {order_number} status updated to '{status}'")
+                logger.debug("Order %s status updated to '%s'", order_number, status)
                 return True
             else:
-                print(f"No order found with number {order_number}")
+                logger.warning("No order found with number %s", order_number)
                 return False
     except Exception as err:
-        print(f"Failed to update order status: {err}")
+        logger.error("Failed to update order status: %s", err)
+        if not commit:
+            raise
         connection.rollback()
         return False
 
 
+def update_order_statuses_bulk(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
+                               updates: List[Tuple[int, str, Optional[date]]],
+                               commit: bool = True) -> int:
+    """
+    Update the status (and optionally shipped date) of many orders in one statement.
+    
+    Updates are merged into UPDATE ... SET status = CASE orderNumber WHEN ... END
+    WHERE orderNumber IN (...), one statement per chunk of 1000 orders. As in
+    update_order_status, a None shipped date leaves the stored date unchanged.
+    
+    Args:
+        connection: Active MySQL connection
+        updates: Tuples of (order_number, status, shipped_date or None);
+                 the last entry wins for duplicate order numbers
+        commit: Commit on success and roll back on failure (default: True); pass False
+                inside transaction() to let the caller commit, errors are then re-raised
+        
+    Returns:
+        Number of updated rows (0 on failure, all chunks are rolled back)
+    """
+    latest = {order_number: (status, shipped_date) for order_number, status, shipped_date in updates}
+    if not latest:
+        return 0
+    
+    keys = [("orders", order_number) for order_number in latest]
+    invalidate_before_write(connection, keys, commit)
+    
+    updated = 0
+    
+    try:
+        with connection.cursor() as cursor:
+            for chunk in chunk_ids(latest):
+                status_whens = []
+                status_params = []
+                shipped_whens = []
+                shipped_params = []
+                for order_number in chunk:
+                    status, shipped_date = latest[order_number]
+                    status_whens.append("WHEN %s THEN %s")
+                    status_params.extend((order_number, status))
+                    if shipped_date is not None:
+                        shipped_whens.append("WHEN %s THEN %s")
+                        shipped_params.extend((order_number, shipped_date))
+                
+                assignments = f"status = CASE orderNumber {' '.join(status_whens)} END"
+                if shipped_whens:
+                    assignments += f", shippedDate = CASE orderNumber {' '.join(shipped_whens)} ELSE shippedDate END"
+                placeholders = ", ".join(["%s"] * len(chunk))
+                query = _SQL_UPDATE_ORDER_STATUSES_BULK.format(assignments=assignments,
+                                                               placeholders=placeholders)
+                cursor.execute(query, (*status_params, *shipped_params, *chunk))
+                updated += cursor.rowcount
+            if commit:
+                connection.commit()
+                cache.pop_all(keys)
+            logger.debug("Updated status of %d orders", updated)
+            return updated
+    except Exception as err:
+        logger.error("Failed to bulk update order statuses: %s", err)
+        if not commit:
+            raise
+        connection.rollback()
+        return 0
+
+
 def get_order_details(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection],
                      order_number: int) -> List[Any]:
     """
@@ -215,21 +481,12 @@ def get_order_details(connection: Union[MySQLConnectionAbstract, PooledMySQLConn
     Returns:
         List of order detail tuples
     """
-    query = '''
-    SELECT od.orderNumber, od.productCode, p.productName, 
-           od.quantityOrdered, od.priceEach, od.orderLineNumber
-    FROM orderdetails od
-    JOIN products p ON od.productCode = p.productCode
-    WHERE od.orderNumber = %s
-    ORDER BY od.orderLineNumber
-    '''
-    
     try:
         with connection.cursor() as cursor:
-            cursor.execute(query, (order_number,))
+            cursor.execute(_SQL_GET_ORDER_DETAILS, (order_number,))
             rows = cursor.fetchall()
-            print(f"Found {len(rows)} line items for order {order_number}")
+            logger.debug("Found %d line items for order %s", len(rows), order_number)
             return rows
     except Exception as err:
-        print(f"Failed to query order details: {err}")
+        logger.error("Failed to query order details: %s", err)
         return []
@@ -1,8 +1,9 @@
 """Database package initialization."""
 
-from .mysql_client import MySqlClient, mysql_client
+from .mysql_client import MySqlClient, mysql_client, transaction
 
 __all__ = [
     'MySqlClient',
-    'mysql_client'
+    'mysql_client',
+    'transaction'
 ]
@@ -3,105 +3,184 @@ Database connection module.
 Handles MySQL database connections with reconnection logic.
 """
 
+import random
+import threading
 import time
+from contextlib import contextmanager
 import mysql.connector
 from mysql.connector import errorcode
 from mysql.connector.abstracts import MySQLConnectionAbstract
-from mysql.connector.pooling import PooledMySQLConnection
-from typing import Union, Optional
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
+from typing import Any, Iterator, Mapping, Union, Optional
+from dal import release_pending_writes
 from db.mysql_config import DB_CONFIG
 
+DEFAULT_POOL_SIZE = 8
+
 class MySqlClient:
     """
     Database connection manager with automatic retry logic and connection pooling.
     """
     
-    def __init__(self, config: dict, attempts: int = 3, delay: int = 2):
+    def __init__(self, config: Mapping[str, Any], attempts: int = 3, delay: int = 2):
         """
         Initialize database connection manager.
         
         Args:
-            config: Database configuration dictionary
+            config: Database configuration mapping (may contain 'pool_size', default: 8)
             attempts: Number of connection attempts (default: 3)
             delay: Base delay between retries in seconds (default: 2)
         """
-        self.config = config
+        self.config = dict(config)
+        self.pool_size = self.config.pop('pool_size', DEFAULT_POOL_SIZE)
+        # Sessions are not reset when a connection returns to the pool (see _create_pool),
+        # so run in autocommit mode: a borrower that only reads must not leave an open
+        # transaction (and its stale snapshot) behind for the next one
+        self.config.setdefault('autocommit', True)
         self.attempts = attempts
         self.delay = delay
-        self._connection: Optional[Union[MySQLConnectionAbstract, PooledMySQLConnection]] = None
+        self._pool: Optional[MySQLConnectionPool] = None
+        # Serializes pool creation so concurrent first callers build a single pool
+        self._pool_lock = threading.Lock()
     
     def connect(self) -> Union[MySQLConnectionAbstract, PooledMySQLConnection, None]:
         """
-        Connect to MySQL database with automatic retry logic.
+        Create the connection pool if needed and borrow a connection from it.
+        
+        Returns:
+            Pooled connection or None if connection fails
+        """
+        return self.get_connection()
+    
+    def _ensure_pool(self) -> bool:
+        """
+        Create the connection pool once, even when several threads ask at the same time.
         
         Returns:
-            MySQLConnection object or None if connection fails
+            True if the pool exists, False if it could not be created
+        """
+        if self._pool is not None:
+            return True
+        with self._pool_lock:
+            if self._pool is None:
+                return self._create_pool()
+            return True
+    
+    def _create_pool(self) -> bool:
+        """
+        Create the connection pool with automatic retry logic.
+        
+        Must be called with _pool_lock held and no existing pool.
+        
+        Returns:
+            True if the pool was created, False otherwise
         """
         attempt = 1
         
         while attempt < self.attempts + 1:
             try:
-                self._connection = mysql.connector.connect(**self.config)
-                print(f"Successfully connected to database: {self.config.get('database')}")
-                return self._connection
+                # No session reset on return: a reset would drop the DAL's server-side
+                # prepared statements on every borrow. Session state (user variables,
+                # temporary tables, SET SESSION ...) therefore carries over between borrowers.
+                self._pool = MySQLConnectionPool(pool_name="classic",
+                                                 pool_size=self.pool_size,
+                                                 pool_reset_session=False,
+                                                 **self.config)
+                print(f"Successfully connected to database: {self.config.get('database')} "
+                      f"(pool size {self.pool_size})")
+                return True
             except mysql.connector.Error as err:
+                # Permanent errors: retrying cannot succeed, fail fast
                 if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
                     print("Access denied: Wrong username or password")
+                    return False
                 elif err.errno == errorcode.ER_BAD_DB_ERROR:
                     print("Database does not exist")
+                    return False
                 else:
                     print(f"Connection error: {err}")
                     
                 if self.attempts == attempt:
                     print(f"Failed to connect after {self.attempts} attempts, exiting without a connection")
-                    return None
+                    return False
                     
                 print(f"Connection failed: {err}. Retrying ({attempt}/{self.attempts - 1})...")
-                # Progressive reconnect delay (exponential backoff)
-                time.sleep(self.delay ** attempt)
+                time.sleep(self._backoff(attempt))
                 attempt += 1
             except IOError as err:
                 print(f"I/O error: {err}")
                 if self.attempts == attempt:
-                    return None
-                time.sleep(self.delay ** attempt)
+                    return False
+                time.sleep(self._backoff(attempt))
                 attempt += 1
                 
-        return None
+        return False
+    
+    def _backoff(self, attempt: int) -> float:
+        """
+        Delay before the next connection attempt.
+        
+        Exponential backoff (delay, 2*delay, 4*delay, ...) plus up to one delay of
+        random jitter so many clients don't reconnect in lockstep.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            
+        Returns:
+            Seconds to sleep
+        """
+        return self.delay * (1 << (attempt - 1)) + random.uniform(0, self.delay)
     
     def get_connection(self) -> Union[MySQLConnectionAbstract, PooledMySQLConnection, None]:
         """
-        Get the current database connection or create a new one.
+        Borrow a connection from the pool, creating the pool on first use.
+        
+        The returned PooledMySQLConnection goes back to the pool when closed.
+        A dropped pooled connection is reconnected by the pool itself, so a
+        failed borrow returns None and leaves the shared pool (and connections
+        other threads have borrowed from it) untouched.
         
         Returns:
-            MySQLConnection object or None if connection fails
+            PooledMySQLConnection object or None if connection fails
         """
-        if self._connection is None or not self.is_connected():
-            return self.connect()
-        return self._connection
+        if not self._ensure_pool():
+            return None
+        try:
+            return self._pool.get_connection()
+        except mysql.connector.errors.PoolError as err:
+            print(f"No pooled connection available: {err}")
+            return None
+        except mysql.connector.Error as err:
+            print(f"Failed to get pooled connection: {err}")
+            return None
     
     def is_connected(self) -> bool:
         """
-        Check if the database connection is active.
+        Check if the connection pool has been created.
+        
+        This only reflects local state and sends nothing to the server, so it does
+        not prove the server is still reachable; the pool itself checks each
+        connection (a ping, reconnecting if needed) when it is borrowed.
         
         Returns:
-            True if connected, False otherwise
+            True if the pool exists, False otherwise
         """
-        if self._connection is None:
-            return False
-        try:
-            return self._connection.is_connected()
-        except:
-            return False
+        return self._pool is not None
     
     def close(self) -> None:
         """
-        Close the database connection.
-        """
-        if self._connection and self.is_connected():
-            self._connection.close()
-            print("Database connection closed")
-            self._connection = None
+        Close all idle pooled connections and drop the pool.
+        
+        Borrowed connections are unaffected and close normally when returned.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                try:
+                    self._pool._remove_connections()
+                except mysql.connector.Error as err:
+                    print(f"Error while closing pooled connections: {err}")
+                print("Database connection pool closed")
+                self._pool = None
     
     def test_connection(self) -> bool:
         """
@@ -110,21 +189,21 @@ class MySqlClient:
         Returns:
             True if connection successful, False otherwise
         """
-        test_conn = mysql.connector.connect(**self.config)
-        
-        if test_conn and test_conn.is_connected():
-            print("Connection test successful")
-            test_conn.close()
-            return True
-        else:
-            print("Connection test failed")
+        try:
+            test_conn = mysql.connector.connect(**self.config)
+        except mysql.connector.Error as err:
+            print(f"Connection test failed: {err}")
             return False
+        
+        print("Connection test successful")
+        test_conn.close()
+        return True
     
     def __enter__(self):
         """
-        Context manager entry point.
+        Context manager entry point (creates the pool without borrowing a connection).
         """
-        self.connect()
+        self._ensure_pool()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -134,4 +213,39 @@ class MySqlClient:
         self.close()
         return False
 
+
+@contextmanager
+def transaction(connection: Union[MySQLConnectionAbstract, PooledMySQLConnection]
+                ) -> Iterator[Union[MySQLConnectionAbstract, PooledMySQLConnection]]:
+    """
+    Run a block of statements as one transaction with a single commit.
+    
+    Use with DAL mutations called with commit=False, e.g.:
+        with transaction(conn):
+            for row in rows:
+                insert_customer(conn, *row, commit=False)
+    
+    START TRANSACTION suspends autocommit until the commit or rollback, so the
+    session's autocommit setting is neither read (a server round trip) nor
+    changed. A connection with autocommit off that is already inside a
+    transaction continues it instead.
+    
+    Args:
+        connection: Active MySQL connection
+        
+    Yields:
+        The same connection
+    """
+    if not connection.in_transaction:
+        connection.start_transaction()
+    try:
+        yield connection
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        # Rows written inside the block may be cached again now that it has ended
+        release_pending_writes(connection)
+
 mysql_client = MySqlClient(DB_CONFIG)
@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+from types import MappingProxyType
 import os
 
 load_dotenv()
@@ -8,14 +9,17 @@ Database configuration module.
 Store database credentials separately from main code (security best practice).
 """
 
-# Database configuration dictionary
-DB_CONFIG = {
+# Database configuration, read once at import and frozen (read-only view)
+DB_CONFIG = MappingProxyType({
     'user': os.getenv('DB_USER'),
     'password': os.getenv('DB_PASSWORD'),
     'host': os.getenv('DB_HOST'),
     'port': int(os.getenv('DB_PORT', 3306)),
     'database': os.getenv('DB_NAME'),
-}
+    # Use the C extension (row decoding in C); the connector falls back to the
+    # pure-Python protocol when the extension is not available
+    'use_pure': False,
+})
 
 
 CONNECTION_ATTEMPTS = 3
@@ -3,30 +3,35 @@ Main application module for MySQL Connector demo.
 Demonstrates MySQL database operations using mysql-connector-python with ClassicModels database.
 """
 
-import mysql.connector
+import logging
 from db.mysql_client import mysql_client
-from db.mysql_config import DB_CONFIG
 from dal import (
     # Customer operations
     get_all_customers,
-    get_customer_by_number,
     get_customers_by_country,
+    get_customer_with_orders,
     
     # Order operations
     get_all_orders,
-    get_order_by_number,
-    get_order_details,
-    get_orders_by_customer
+    get_order_summary_by_number,
+    get_order_details
 )
 
-def connect_and_query():
-    connection = mysql.connector.connect(**DB_CONFIG)
-    cursor = connection.cursor()
-    cursor.execute("SELECT * FROM customers LIMIT 3")
-    records = cursor.fetchall()
+logger = logging.getLogger(__name__)
 
-    for record in records:
-        print(record)
+def connect_and_query():
+    connection = mysql_client.get_connection()
+    if not connection:
+        print("Could not connect to database. Exiting.")
+        return
+    
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT * FROM customers LIMIT 3")
+            records = cursor.fetchall()
+            logger.debug("Fetched %d records: %s", len(records), records)
+    finally:
+        connection.close()
 
 
 def main():
@@ -37,7 +42,7 @@ def main():
     # Connect to database
     connection = mysql_client.get_connection()
     
-    if not connection or not connection.is_connected():
+    if not connection:
         print("Could not connect to database. Exiting.")
         return
     
@@ -53,17 +58,22 @@ def main():
         # # Example 2: Get a specific customer and their orders
         # print("\n2. CUSTOMER DETAILS AND ORDERS:")
         # print("-"*60)
-        # customer = get_customer_by_number(connection, 103)
-        # if customer:
+        # # Customer and orders come back from one LEFT JOIN (one row per order)
+        # rows = get_customer_with_orders(connection, 103)
+        # if rows:
+        #     customer = rows[0]
         #     print(f"Customer: {customer[1]}")
         #     print(f"Contact: {customer[3]} {customer[2]}")
-        #     print(f"Location: {customer[7]}, {customer[11]}")
+        #     print(f"Location: {customer[5]}, {customer[6]}")
             
-        #     # Get customer's orders
-        #     orders = get_orders_by_customer(connection, 103)
+        #     # Group the joined rows by orderNumber
+        #     orders = {}
+        #     for row in rows:
+        #         if row[7] is not None:
+        #             orders.setdefault(row[7], row[7:])
         #     print(f"\nOrders: {len(orders)} total")
-        #     for order in orders[:3]:  # Show first 3
-        #         print(f"  - Order #{order[0]}, Date: {order[1]}, Status: {order[4]}")
+        #     for order in list(orders.values())[:3]:  # Show first 3
+        #         print(f"  - Order #{order[0]}, Date: {order[1]}, Status: {order[2]}")
         
         # # Example 3: Get all orders
         # print("\n3. RECENT ORDERS:")
@@ -75,9 +85,9 @@ def main():
         # # Example 4: Get order details
         # print("\n4. ORDER DETAILS (Order #10100):")
         # print("-"*60)
-        # order = get_order_by_number(connection, 10100)
+        # order = get_order_summary_by_number(connection, 10100)
         # if order:
-        #     print(f"Order Date: {order[1]}, Status: {order[4]}")
+        #     print(f"Order Date: {order[1]}, Status: {order[2]}")
             
         #     details = get_order_details(connection, 10100)
         #     print(f"Line Items: {len(details)}")
@@ -92,12 +102,12 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        # Always close the connection
-        if connection.is_connected():
-            connection.close()
-            print("Database connection closed")
+        # Always close the connection (returns it to the pool)
+        connection.close()
+        print("Database connection closed")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     # main()
     connect_and_query()
\ No newline at end of file